@@ -28,6 +28,14 @@ def boolean_normalizer(val):
     return val in ["true", "1"]
 
 
+def positive_int_validator(val):
+    return val.isdigit() and int(val) > 0
+
+
+def int_normalizer(val):
+    return int(val)
+
+
 class Config(object):
 
     default_config = {
@@ -37,6 +45,7 @@ class Config(object):
             "in-project": False,
             "path": os.path.join("{cache-dir}", "virtualenvs"),
         },
+        "installer": {"max-workers": 1},
     }
 
     def __init__(
@@ -136,6 +145,9 @@ class Config(object):
         if name == "virtualenvs.path":
             return str
 
+        if name == "installer.max-workers":
+            return positive_int_validator
+
     def _get_normalizer(self, name):  # type: (str) -> Callable
         if name in {"virtualenvs.create", "virtualenvs.in-project"}:
             return boolean_normalizer
@@ -143,4 +155,7 @@ class Config(object):
         if name == "virtualenvs.path":
             return lambda val: str(Path(val))
 
+        if name == "installer.max-workers":
+            return int_normalizer
+
         return lambda val: val
@@ -41,6 +41,8 @@ To remove a repository (repo is a short alias for repositories):
     def unique_config_values(self):
         from poetry.config.config import boolean_normalizer
         from poetry.config.config import boolean_validator
+        from poetry.config.config import int_normalizer
+        from poetry.config.config import positive_int_validator
         from poetry.locations import CACHE_DIR
         from poetry.utils._compat import Path
 
@@ -57,6 +59,7 @@ To remove a repository (repo is a short alias for repositories):
                 lambda val: str(Path(val)),
                 str(Path(CACHE_DIR) / "virtualenvs"),
             ),
+            "installer.max-workers": (positive_int_validator, int_normalizer, 1),
         }
 
         return unique_config_values
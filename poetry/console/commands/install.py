@@ -51,7 +51,12 @@ dependencies and not including the current project, run the command with the
         from poetry.masonry.utils.module import ModuleOrPackageNotFound
 
         installer = Installer(
-            self.io, self.env, self.poetry.package, self.poetry.locker, self.poetry.pool
+            self.io,
+            self.env,
+            self.poetry.package,
+            self.poetry.locker,
+            self.poetry.pool,
+            config=self.poetry.config,
         )
 
         extras = []
@@ -63,7 +63,12 @@ list of installed packages
         self.reset_poetry()
 
         installer = Installer(
-            self.io, self.env, self.poetry.package, self.poetry.locker, self.poetry.pool
+            self.io,
+            self.env,
+            self.poetry.package,
+            self.poetry.locker,
+            self.poetry.pool,
+            config=self.poetry.config,
         )
 
         installer.dry_run(self.option("dry-run"))
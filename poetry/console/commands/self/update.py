@@ -185,10 +185,12 @@ class SelfUpdateCommand(Command):
         meta = r.info()
         size = int(meta["Content-Length"])
         current = 0
-        block_size = 8192
+        block_size = 64 * 1024
 
         bar = self.progress_bar(max=size)
         bar.set_format(" - Downloading <info>{}</> <comment>%percent%%</>".format(name))
+        # Only redraw the bar when the percentage actually changes
+        bar.set_redraw_frequency(max(1, size // 100))
         bar.start()
 
         sha = hashlib.sha256()
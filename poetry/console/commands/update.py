@@ -33,7 +33,12 @@ class UpdateCommand(EnvCommand):
         packages = self.argument("packages")
 
         installer = Installer(
-            self.io, self.env, self.poetry.package, self.poetry.locker, self.poetry.pool
+            self.io,
+            self.env,
+            self.poetry.package,
+            self.poetry.locker,
+            self.poetry.pool,
+            config=self.poetry.config,
         )
 
         if packages:
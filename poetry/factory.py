@@ -1,11 +1,17 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import errno
+import os
 import shutil
 
+from copy import deepcopy
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
+
+import tomlkit
 
 from clikit.api.io.io import IO
 
@@ -18,12 +24,88 @@ from .packages.dependency import Dependency
 from .packages.locker import Locker
 from .packages.project_package import ProjectPackage
 from .poetry import Poetry
-from .repositories.pypi_repository import PyPiRepository
 from .spdx import license_by_id
 from .utils._compat import Path
 from .utils.toml_file import TomlFile
 
 
+# Optional speedup: tomllib is only available on Python 3.11+
+# and tomli is not a dependency of poetry, so without them
+# read-only files are parsed with tomlkit like the other ones.
+try:
+    import tomllib as toml_reader
+except ImportError:
+    try:
+        import tomli as toml_reader
+    except ImportError:
+        toml_reader = None
+
+
+def _read_toml_fast(path):  # type: (Path) -> dict
+    """
+    Parses a TOML file which will not be written back.
+
+    tomlkit preserves the style of the document, which is costly and useless
+    for read-only files, so tomllib (or tomli) is used when available.
+    The file is read in a single call and parsed from memory.
+
+    Invalid files are always reported by tomlkit so that the raised errors
+    do not depend on the installed packages.
+    """
+    content = Path(path).read_bytes().decode("utf-8")
+
+    if toml_reader is not None:
+        try:
+            return toml_reader.loads(content)
+        except toml_reader.TOMLDecodeError:
+            pass
+
+    return tomlkit.parse(content)
+
+
+def _file_stamp(path):  # type: (Path) -> Optional[Tuple[float, int]]
+    """
+    Returns a key identifying the current state of a file
+    or None if it does not exist.
+    """
+    try:
+        st = os.stat(str(path))
+    except OSError:
+        return None
+
+    return getattr(st, "st_mtime_ns", st.st_mtime), st.st_size
+
+
+_TOML_CACHE = {}  # type: Dict[str, Tuple[Tuple[float, int], dict]]
+
+
+def _load_optional_toml(path):  # type: (Path) -> Optional[dict]
+    """
+    Returns the parsed content of a read-only TOML file, or None if it does
+    not exist, only parsing it again if it changed since the last call.
+    """
+    key = _file_stamp(path)
+    if key is None:
+        return
+
+    cached = _TOML_CACHE.get(str(path))
+    if cached is None or cached[0] != key:
+        try:
+            cached = (key, _read_toml_fast(path))
+        except (IOError, OSError) as e:
+            # The file has been removed in the meantime
+            if e.errno != errno.ENOENT:
+                raise
+
+            return
+
+        _TOML_CACHE[str(path)] = cached
+
+    # Callers merge the data into their own structures
+    # so we must never hand out the cached one.
+    return deepcopy(cached[1])
+
+
 class Factory:
     """
     Factory class to create various elements needed by Poetry.
@@ -147,20 +229,21 @@ class Factory:
             if old_lock.exists():
                 shutil.move(str(old_lock), str(lock))
 
-        locker = Locker(poetry_file.parent / "poetry.lock", local_config)
+        locker = Locker(
+            poetry_file.parent / "poetry.lock", local_config, loader=_read_toml_fast
+        )
 
         # Loading global configuration
         config = self.create_config(io)
 
         # Loading local configuration
-        local_config_file = TomlFile(poetry_file.parent / "poetry.toml")
-        if local_config_file.exists():
+        local_config_file = poetry_file.parent / "poetry.toml"
+        local_config_data = _load_optional_toml(local_config_file)
+        if local_config_data is not None:
             if io.is_debug():
-                io.write_line(
-                    "Loading configuration file {}".format(local_config_file.path)
-                )
+                io.write_line("Loading configuration file {}".format(local_config_file))
 
-            config.merge(local_config_file.read())
+            config.merge(local_config_data)
 
         poetry = Poetry(poetry_file, local_config, package, locker, config)
 
@@ -185,6 +268,8 @@ class Factory:
         # Always put PyPI last to prefer private repositories
         # but only if we have no other default source
         if not poetry.pool.has_default():
+            from .repositories.pypi_repository import PyPiRepository
+
             poetry.pool.add_repository(PyPiRepository(), True)
         else:
             if io.is_debug():
@@ -197,33 +282,27 @@ class Factory:
         if io is None:
             io = NullIO()
 
-        config = Config()
-        # Load global config
         config_file = TomlFile(Path(CONFIG_DIR) / "config.toml")
-        if config_file.exists():
-            if io.is_debug():
-                io.write_line(
-                    "<debug>Loading configuration file {}</debug>".format(
-                        config_file.path
-                    )
-                )
+        auth_config_file = TomlFile(Path(CONFIG_DIR) / "auth.toml")
 
-            config.merge(config_file.read())
+        config = Config()
 
-        config.set_config_source(FileConfigSource(config_file))
+        # Load global config and global auth config
+        for toml_file in (config_file, auth_config_file):
+            config_data = _load_optional_toml(toml_file.path)
+            if config_data is None:
+                continue
 
-        # Load global auth config
-        auth_config_file = TomlFile(Path(CONFIG_DIR) / "auth.toml")
-        if auth_config_file.exists():
             if io.is_debug():
                 io.write_line(
                     "<debug>Loading configuration file {}</debug>".format(
-                        auth_config_file.path
+                        toml_file.path
                     )
                 )
 
-            config.merge(auth_config_file.read())
+            config.merge(config_data)
 
+        config.set_config_source(FileConfigSource(config_file))
         config.set_auth_config_source(FileConfigSource(auth_config_file))
 
         return config
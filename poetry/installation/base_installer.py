@@ -2,6 +2,10 @@ class BaseInstaller:
     def install(self, package):
         raise NotImplementedError
 
+    def install_batch(self, packages):
+        for package in packages:
+            self.install(package)
+
     def update(self, source, target):
         raise NotImplementedError
 
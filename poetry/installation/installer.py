@@ -1,9 +1,15 @@
+import threading
+
+from functools import partial
+from itertools import groupby
 from typing import List
+from typing import Optional
 from typing import Union
 
 from clikit.api.io import IO
 from clikit.io import NullIO
 
+from poetry.config.config import Config
 from poetry.packages import Locker
 from poetry.packages import Package
 from poetry.puzzle import Solver
@@ -22,7 +28,20 @@ from .base_installer import BaseInstaller
 from .pip_installer import PipInstaller
 
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+
 class Installer:
+
+    _operation_handlers = {
+        "install": "_execute_install",
+        "update": "_execute_update",
+        "uninstall": "_execute_uninstall",
+    }
+
     def __init__(
         self,
         io,  # type: IO
@@ -31,12 +50,15 @@ class Installer:
         locker,  # type: Locker
         pool,  # type: Pool
         installed=None,  # type: (Union[InstalledRepository, None])
+        config=None,  # type: Optional[Config]
     ):
         self._io = io
+        self._io_lock = threading.Lock()
         self._env = env
         self._package = package
         self._locker = locker
         self._pool = pool
+        self._config = config
 
         self._dry_run = False
         self._update = False
@@ -282,8 +304,7 @@ class Installer:
             )
 
         self._io.write_line("")
-        for op in ops:
-            self._execute(op)
+        self._execute_all(ops)
 
     def _write_lock_file(self, repo):  # type: (Repository) -> None
         if self._update and self._write_lock:
@@ -293,18 +314,68 @@ class Installer:
                 self._io.write_line("")
                 self._io.write_line("<info>Writing lock file</>")
 
+    def _execute_all(self, ops):  # type: (List[Operation]) -> None
+        # Operations are sorted by depth in the dependency graph
+        # and operations at the same depth do not depend on each other
+        # so they are executed one level at a time.
+        levels = groupby(ops, key=lambda op: (op.job_type == "uninstall", op.priority))
+
+        max_workers = self._get_max_workers()
+        if max_workers == 1:
+            for _, level in levels:
+                for task in self._get_tasks(list(level)):
+                    task()
+
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _, level in levels:
+                # Consuming the results re-raises the first error, if any
+                list(executor.map(lambda task: task(), self._get_tasks(list(level))))
+
+    def _get_tasks(self, level):  # type: (List[Operation]) -> list
+        """
+        Returns the callables executing the operations of a single level.
+
+        Fresh installs are grouped together so that the underlying
+        installer can process them at once.
+        """
+        batch = []
+        if self._execute_operations:
+            batch = [op for op in level if op.job_type == "install" and not op.skipped]
+
+        if len(batch) < 2:
+            return [partial(self._execute, op) for op in level]
+
+        tasks = []
+        for op in level:
+            if op is batch[0]:
+                tasks.append(partial(self._execute_install_batch, batch))
+            elif op not in batch:
+                tasks.append(partial(self._execute, op))
+
+        return tasks
+
+    def _get_max_workers(self):  # type: () -> int
+        if (
+            ThreadPoolExecutor is None
+            or self._config is None
+            or not self._execute_operations
+        ):
+            return 1
+
+        return self._config.get("installer.max-workers") or 1
+
     def _execute(self, operation):  # type: (Operation) -> None
         """
         Execute a given operation.
         """
-        method = operation.job_type
-
-        getattr(self, "_execute_{}".format(method))(operation)
+        getattr(self, self._operation_handlers[operation.job_type])(operation)
 
     def _execute_install(self, operation):  # type: (Install) -> None
         if operation.skipped:
             if self.is_verbose() and (self._execute_operations or self.is_dry_run()):
-                self._io.write_line(
+                self._write_line(
                     "  - Skipping <c1>{}</c1> (<b>{}</b>) {}".format(
                         operation.package.pretty_name,
                         operation.package.full_pretty_version,
@@ -315,24 +386,33 @@ class Installer:
             return
 
         if self._execute_operations or self.is_dry_run():
-            self._io.write_line(
-                "  - Installing <c1>{}</c1> (<b>{}</b>)".format(
-                    operation.package.pretty_name, operation.package.full_pretty_version
-                )
-            )
+            self._write_installing(operation.package)
 
         if not self._execute_operations:
             return
 
         self._installer.install(operation.package)
 
+    def _execute_install_batch(self, operations):  # type: (List[Install]) -> None
+        for operation in operations:
+            self._write_installing(operation.package)
+
+        self._installer.install_batch([operation.package for operation in operations])
+
+    def _write_installing(self, package):  # type: (Package) -> None
+        self._write_line(
+            "  - Installing <c1>{}</c1> (<b>{}</b>)".format(
+                package.pretty_name, package.full_pretty_version
+            )
+        )
+
     def _execute_update(self, operation):  # type: (Update) -> None
         source = operation.initial_package
         target = operation.target_package
 
         if operation.skipped:
             if self.is_verbose() and (self._execute_operations or self.is_dry_run()):
-                self._io.write_line(
+                self._write_line(
                     "  - Skipping <c1>{}</c1> (<b>{}</b>) {}".format(
                         target.pretty_name,
                         target.full_pretty_version,
@@ -343,7 +423,7 @@ class Installer:
             return
 
         if self._execute_operations or self.is_dry_run():
-            self._io.write_line(
+            self._write_line(
                 "  - Updating <c1>{}</c1> (<b>{}</b> -> <b>{}</b>)".format(
                     target.pretty_name,
                     source.full_pretty_version,
@@ -359,7 +439,7 @@ class Installer:
     def _execute_uninstall(self, operation):  # type: (Uninstall) -> None
         if operation.skipped:
             if self.is_verbose() and (self._execute_operations or self.is_dry_run()):
-                self._io.write_line(
+                self._write_line(
                     "  - Not removing <c1>{}</c1> (<b>{}</b>) {}".format(
                         operation.package.pretty_name,
                         operation.package.full_pretty_version,
@@ -370,7 +450,7 @@ class Installer:
             return
 
         if self._execute_operations or self.is_dry_run():
-            self._io.write_line(
+            self._write_line(
                 "  - Removing <c1>{}</c1> (<b>{}</b>)".format(
                     operation.package.pretty_name, operation.package.full_pretty_version
                 )
@@ -381,6 +461,11 @@ class Installer:
 
         self._installer.remove(operation.package)
 
+    def _write_line(self, line):  # type: (str) -> None
+        # Operations might be executed concurrently
+        with self._io_lock:
+            self._io.write_line(line)
+
     def _populate_local_repo(self, local_repo, ops):
         for op in ops:
             if isinstance(op, Uninstall):
@@ -1,16 +1,26 @@
+import hashlib
 import os
+import re
 import tempfile
+import zipfile
 
+from base64 import urlsafe_b64encode
 from io import open
 from subprocess import CalledProcessError
+from typing import List
+from typing import Optional
 
 from clikit.api.io import IO
 from clikit.io import NullIO
 
+from poetry.packages import Package
 from poetry.repositories.pool import Pool
+from poetry.utils._compat import OrderedDict
+from poetry.utils._compat import Path
 from poetry.utils._compat import encode
 from poetry.utils.env import Env
 from poetry.utils.helpers import safe_rmtree
+from poetry.utils.patterns import wheel_file_re
 
 from .base_installer import BaseInstaller
 
@@ -38,37 +48,15 @@ class PipInstaller(BaseInstaller):
 
             return
 
-        args = ["install", "--no-deps"]
+        if package.source_type == "file" and not update:
+            archive = Path(self.requirement(package))
+            if self._is_simple_wheel(archive):
+                # No need to spawn pip to unpack a pure Python wheel
+                self.install_wheel(archive)
 
-        if (
-            package.source_type not in {"git", "directory", "file", "url"}
-            and package.source_url
-        ):
-            repository = self._pool.repository(package.source_reference)
-            parsed = urlparse.urlparse(package.source_url)
-            if parsed.scheme == "http":
-                self._io.error(
-                    "    <warning>Installing from unsecure host: {}</warning>".format(
-                        parsed.hostname
-                    )
-                )
-                args += ["--trusted-host", parsed.hostname]
-
-            if repository.cert:
-                args += ["--cert", str(repository.cert)]
-
-            if repository.client_cert:
-                args += ["--client-cert", str(repository.client_cert)]
-
-            index_url = repository.authenticated_url
+                return
 
-            args += ["--index-url", index_url]
-            if self._pool.has_default():
-                if repository.name != self._pool.repositories[0].name:
-                    args += [
-                        "--extra-index-url",
-                        self._pool.repositories[0].authenticated_url,
-                    ]
+        args = ["install", "--no-deps"] + self._get_index_args(package)
 
         if update:
             args.append("-U")
@@ -96,6 +84,81 @@ class PipInstaller(BaseInstaller):
 
             self.run(*args)
 
+    def install_batch(self, packages):  # type: (List[Package]) -> None
+        """
+        Installs packages coming from package indices with a single pip call
+        per index, instead of one per package.
+        """
+        batches = OrderedDict()
+        for package in packages:
+            if package.source_type in {"git", "directory", "file", "url"}:
+                self.install(package)
+
+                continue
+
+            key = (
+                package.source_reference,
+                bool(package.files and not package.source_url),
+            )
+            batches.setdefault(key, []).append(package)
+
+        for (_, with_hashes), batch in batches.items():
+            if len(batch) == 1:
+                self.install(batch[0])
+
+                continue
+
+            args = ["install", "--no-deps"] + self._get_index_args(batch[0])
+
+            if with_hashes:
+                req = self.create_temporary_requirement(*batch)
+                args += ["-r", req]
+
+                try:
+                    self.run(*args)
+                finally:
+                    os.unlink(req)
+            else:
+                args += [self.requirement(package) for package in batch]
+
+                self.run(*args)
+
+    def _get_index_args(self, package):  # type: (Package) -> List[str]
+        if (
+            package.source_type in {"git", "directory", "file", "url"}
+            or not package.source_url
+        ):
+            return []
+
+        args = []
+        repository = self._pool.repository(package.source_reference)
+        parsed = urlparse.urlparse(package.source_url)
+        if parsed.scheme == "http":
+            self._io.error(
+                "    <warning>Installing from unsecure host: {}</warning>".format(
+                    parsed.hostname
+                )
+            )
+            args += ["--trusted-host", parsed.hostname]
+
+        if repository.cert:
+            args += ["--cert", str(repository.cert)]
+
+        if repository.client_cert:
+            args += ["--client-cert", str(repository.client_cert)]
+
+        index_url = repository.authenticated_url
+
+        args += ["--index-url", index_url]
+        if self._pool.has_default():
+            if repository.name != self._pool.repositories[0].name:
+                args += [
+                    "--extra-index-url",
+                    self._pool.repositories[0].authenticated_url,
+                ]
+
+        return args
+
     def update(self, package, target):
         if package.source_type != target.source_type:
             # If the source type has changed, we remove the current
@@ -168,22 +231,107 @@ class PipInstaller(BaseInstaller):
 
         return "{}=={}".format(package.name, package.version)
 
-    def create_temporary_requirement(self, package):
+    def create_temporary_requirement(self, package, *packages):
         fd, name = tempfile.mkstemp(
             "reqs.txt", "{}-{}".format(package.name, package.version)
         )
 
         try:
-            os.write(fd, encode(self.requirement(package, formatted=True)))
+            os.write(
+                fd,
+                encode(
+                    "".join(
+                        self.requirement(p, formatted=True)
+                        for p in (package,) + packages
+                    )
+                ),
+            )
         finally:
             os.close(fd)
 
         return name
 
+    def install_wheel(self, archive):  # type: (Path) -> None
+        """
+        Installs a wheel by unpacking it in the site-packages directory.
+
+        Only suitable for wheels accepted by _is_simple_wheel().
+        """
+        site_packages = self._env.site_packages
+
+        with zipfile.ZipFile(str(archive)) as wheel:
+            dist_info = self._get_dist_info(wheel)
+            wheel.extractall(str(site_packages))
+
+        # Mark the distribution as installed by us (PEP 376)
+        content = b"poetry\n"
+        hash_digest = (
+            urlsafe_b64encode(hashlib.sha256(content).digest())
+            .decode("ascii")
+            .rstrip("=")
+        )
+        with open(str(site_packages / dist_info / "INSTALLER"), "wb") as f:
+            f.write(content)
+
+        with open(str(site_packages / dist_info / "RECORD"), "ab") as f:
+            f.write(
+                encode(
+                    "{}/INSTALLER,sha256={},{}\n".format(
+                        dist_info, hash_digest, len(content)
+                    )
+                )
+            )
+
+    def _is_simple_wheel(self, archive):  # type: (Path) -> bool
+        """
+        Checks whether a wheel can be installed by merely unpacking it:
+        a pure Python wheel compatible with the environment,
+        without data directories or scripts to generate.
+        """
+        m = wheel_file_re.match(archive.name)
+        if not m or not archive.name.endswith(".whl"):
+            return False
+
+        if m.group("abi") != "none" or m.group("plat") != "any":
+            return False
+
+        python_tag = "py{}".format(self._env.version_info[0])
+        if python_tag not in m.group("pyver").split("."):
+            return False
+
+        with zipfile.ZipFile(str(archive)) as wheel:
+            dist_info = self._get_dist_info(wheel)
+            if dist_info is None:
+                return False
+
+            names = wheel.namelist()
+            if any(name.split("/")[0].endswith(".data") for name in names):
+                return False
+
+            entry_points = dist_info + "/entry_points.txt"
+            if entry_points in names:
+                content = wheel.read(entry_points).decode("utf-8")
+                if "[console_scripts]" in content or "[gui_scripts]" in content:
+                    return False
+
+            metadata = wheel.read(dist_info + "/WHEEL").decode("utf-8")
+
+        return "Root-Is-Purelib: true" in metadata
+
+    def _get_dist_info(self, wheel):  # type: (zipfile.ZipFile) -> Optional[str]
+        dist_infos = {
+            name.split("/")[0]
+            for name in wheel.namelist()
+            if name.split("/")[0].endswith(".dist-info")
+        }
+        if len(dist_infos) != 1:
+            return
+
+        return dist_infos.pop()
+
     def install_directory(self, package):
         from poetry.masonry.builder import SdistBuilder
         from poetry.factory import Factory
-        from poetry.utils._compat import decode
         from poetry.utils.env import NullEnv
         from poetry.utils.toml_file import TomlFile
 
@@ -219,8 +367,13 @@ class PipInstaller(BaseInstaller):
                 Factory().create_poetry(pyproject.parent), NullEnv(), NullIO()
             )
 
-            with open(setup, "w", encoding="utf-8") as f:
-                f.write(decode(builder.build_setup()))
+            # The generated content is already encoded so we write it as is,
+            # without ever overwriting a setup.py file created in the meantime.
+            fd = os.open(setup, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            try:
+                os.write(fd, builder.build_setup())
+            finally:
+                os.close(fd)
 
         if package.develop:
             args.append("-e")
@@ -237,15 +390,16 @@ class PipInstaller(BaseInstaller):
         from poetry.packages import Package
         from poetry.vcs import Git
 
+        git = Git()
         src_dir = self._env.path / "src" / package.name
-        if src_dir.exists():
-            safe_rmtree(str(src_dir))
+        if not self._update_git_clone(git, package, src_dir):
+            if src_dir.exists():
+                safe_rmtree(str(src_dir))
 
-        src_dir.parent.mkdir(exist_ok=True)
+            src_dir.parent.mkdir(exist_ok=True)
 
-        git = Git()
-        git.clone(package.source_url, src_dir)
-        git.checkout(package.source_reference, src_dir)
+            git.clone(package.source_url, src_dir)
+            git.checkout(package.source_reference, src_dir)
 
         # Now we just need to install from the source directory
         pkg = Package(package.name, package.version)
@@ -254,3 +408,35 @@ class PipInstaller(BaseInstaller):
         pkg.develop = package.develop
 
         self.install_directory(pkg)
+
+    def _update_git_clone(self, git, package, src_dir):  # type: (...) -> bool
+        """
+        Brings an existing clone of the package's repository to the required
+        commit, only fetching the missing objects, and removes any file
+        left over by a previous installation.
+
+        Only commit references, as found in lock files, are handled
+        since local branches of the clone may be outdated.
+
+        Returns False if there is no such clone or if it could not be updated.
+        """
+        if not (src_dir / ".git").exists():
+            return False
+
+        if not re.match(r"^[a-f0-9]{40}$", package.source_reference):
+            return False
+
+        try:
+            remote_url = git.remote_urls(folder=src_dir).get("remote.origin.url")
+            if remote_url != package.source_url:
+                return False
+
+            git.fetch(folder=src_dir)
+            # Local changes would prevent the checkout
+            git.reset(folder=src_dir)
+            git.checkout(package.source_reference, src_dir)
+            git.clean(folder=src_dir)
+        except CalledProcessError:
+            return False
+
+        return True
@@ -1,10 +1,11 @@
-import hashlib
-import io
+from typing import Dict
+from typing import Tuple
 
 from pkginfo.distribution import HEADER_ATTRS
 from pkginfo.distribution import HEADER_ATTRS_2_0
 
 from poetry.utils._compat import Path
+from poetry.utils.helpers import sha256_file
 
 from .dependency import Dependency
 
@@ -14,6 +15,10 @@ HEADER_ATTRS.update(
     {"2.1": HEADER_ATTRS_2_0 + (("Provides-Extra", "provides_extra", True),)}
 )
 
+# Hashes already computed, keyed by file path, modification time and size,
+# so that unchanged files are not read again.
+_hashes = {}  # type: Dict[Tuple[str, float, int], str]
+
 
 class FileDependency(Dependency):
     def __init__(
@@ -53,9 +58,13 @@ class FileDependency(Dependency):
         return True
 
     def hash(self):
-        h = hashlib.sha256()
-        with self._full_path.open("rb") as fp:
-            for content in iter(lambda: fp.read(io.DEFAULT_BUFFER_SIZE), b""):
-                h.update(content)
+        st = self._full_path.stat()
+        key = (
+            str(self._full_path),
+            getattr(st, "st_mtime_ns", st.st_mtime),
+            st.st_size,
+        )
+        if key not in _hashes:
+            _hashes[key] = sha256_file(self._full_path)
 
-        return h.hexdigest()
+        return _hashes[key]
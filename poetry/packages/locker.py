@@ -2,7 +2,9 @@ import json
 import re
 
 from hashlib import sha256
+from typing import Callable
 from typing import List
+from typing import Optional
 
 from tomlkit import document
 from tomlkit import inline_table
@@ -22,9 +24,12 @@ class Locker(object):
 
     _relevant_keys = ["dependencies", "dev-dependencies", "source", "extras"]
 
-    def __init__(self, lock, local_config):  # type: (Path, dict) -> None
+    def __init__(
+        self, lock, local_config, loader=None
+    ):  # type: (Path, dict, Optional[Callable[[Path], dict]]) -> None
         self._lock = TomlFile(lock)
         self._local_config = local_config
+        self._loader = loader
         self._lock_data = None
         self._content_hash = self._get_content_hash()
 
@@ -52,7 +57,7 @@ class Locker(object):
         """
         Checks whether the lock file is still up to date with the current hash.
         """
-        lock = self._lock.read()
+        lock = self._read()
         metadata = lock.get("metadata", {})
 
         if "content-hash" in metadata:
@@ -222,10 +227,16 @@ class Locker(object):
             raise RuntimeError("No lockfile found. Unable to read locked packages")
 
         try:
-            return self._lock.read()
+            return self._read()
         except TOMLKitError as e:
             raise RuntimeError("Unable to read the lock file ({}).".format(e))
 
+    def _read(self):  # type: () -> dict
+        if self._loader is None:
+            return self._lock.read()
+
+        return self._loader(self._lock.path)
+
     def _lock_packages(
         self, packages
     ):  # type: (List['poetry.packages.Package']) -> list
@@ -712,7 +712,7 @@ class Provider:
         return package
 
     def debug(self, message, depth=0):
-        if not (self._io.is_very_verbose() or self._io.is_debug()):
+        if not self._is_debugging:
             return
 
         if message.startswith("fact:"):
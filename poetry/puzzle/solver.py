@@ -49,7 +49,7 @@ class Solver:
                 )
 
         operations = []
-        for package in packages:
+        for package, depth in zip(packages, depths):
             installed = False
             for pkg in self._installed.packages:
                 if package.name == pkg.name:
@@ -84,23 +84,27 @@ class Solver:
                                 package.source_reference
                             )
                         ):
-                            operations.append(Update(pkg, package))
+                            operations.append(Update(pkg, package, priority=depth))
                         else:
                             operations.append(
-                                Install(package).skip("Already installed")
+                                Install(package, priority=depth).skip(
+                                    "Already installed"
+                                )
                             )
                     elif package.version != pkg.version:
                         # Checking version
-                        operations.append(Update(pkg, package))
+                        operations.append(Update(pkg, package, priority=depth))
                     elif package.source_type != pkg.source_type:
-                        operations.append(Update(pkg, package))
+                        operations.append(Update(pkg, package, priority=depth))
                     else:
-                        operations.append(Install(package).skip("Already installed"))
+                        operations.append(
+                            Install(package, priority=depth).skip("Already installed")
+                        )
 
                     break
 
             if not installed:
-                operations.append(Install(package))
+                operations.append(Install(package, priority=depth))
 
         # Checking for removals
         for pkg in self._locked.packages:
@@ -129,7 +133,7 @@ class Solver:
                 o.job_type == "uninstall",
                 # Packages to be uninstalled have no depth so we default to 0
                 # since it actually doesn't matter since removals are always on top.
-                -depths[packages.index(o.package)] if o.job_type != "uninstall" else 0,
+                -o.priority,
                 o.package.name,
                 o.package.version,
             ),
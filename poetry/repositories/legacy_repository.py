@@ -25,6 +25,8 @@ from poetry.semver import VersionRange
 from poetry.semver import parse_constraint
 from poetry.utils._compat import Path
 from poetry.utils.helpers import canonicalize_name
+from poetry.utils.helpers import copy_file_url
+from poetry.utils.helpers import is_file_url
 from poetry.utils.inspector import Inspector
 from poetry.utils.patterns import wheel_file_re
 from poetry.version.markers import InvalidMarker
@@ -411,11 +413,16 @@ class LegacyRepository(PyPiRepository):
         return data
 
     def _download(self, url, dest):  # type: (str, str) -> None
-        r = self._session.get(url, stream=True)
-        with open(dest, "wb") as f:
-            for chunk in r.iter_content(chunk_size=1024):
-                if chunk:
-                    f.write(chunk)
+        if is_file_url(url):
+            copy_file_url(url, dest)
+
+            return
+
+        with self._session.get(url, stream=True) as r:
+            with open(dest, "wb") as f:
+                for chunk in r.iter_content(chunk_size=64 * 1024):
+                    if chunk:
+                        f.write(chunk)
 
     def _get(self, endpoint):  # type: (str) -> Union[Page, None]
         url = self._url + endpoint
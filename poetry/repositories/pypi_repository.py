@@ -11,8 +11,8 @@ from cachecontrol.caches.file_cache import FileCache
 from cachecontrol.controller import logger as cache_control_logger
 from cachy import CacheManager
 from html5lib.html5parser import parse
-from requests import get
 from requests import session
+from requests.adapters import HTTPAdapter
 from requests.exceptions import TooManyRedirects
 
 from poetry.locations import CACHE_DIR
@@ -25,6 +25,8 @@ from poetry.semver import parse_constraint
 from poetry.semver.exceptions import ParseVersionError
 from poetry.utils._compat import Path
 from poetry.utils._compat import to_str
+from poetry.utils.helpers import copy_file_url
+from poetry.utils.helpers import is_file_url
 from poetry.utils.helpers import temporary_directory
 from poetry.utils.inspector import Inspector
 from poetry.utils.patterns import wheel_file_re
@@ -73,6 +75,14 @@ class PyPiRepository(RemoteRepository):
         self._session = CacheControl(session(), cache=self._cache_control_cache)
         self._inspector = Inspector()
 
+        # Distributions are downloaded through a dedicated, non-caching,
+        # session so that connections to the files host are kept alive
+        # and reused across downloads.
+        self._download_session = session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=3)
+        self._download_session.mount("http://", adapter)
+        self._download_session.mount("https://", adapter)
+
         self._name = "PyPI"
 
     def find_packages(
@@ -494,13 +504,19 @@ class PyPiRepository(RemoteRepository):
             return self._inspector.inspect_sdist(filepath)
 
     def _download(self, url, dest):  # type: (str, str) -> None
-        r = get(url, stream=True)
-        r.raise_for_status()
+        if is_file_url(url):
+            copy_file_url(url, dest)
+
+            return
+
+        # The response must be closed to release the connection to the pool
+        with self._download_session.get(url, stream=True) as r:
+            r.raise_for_status()
 
-        with open(dest, "wb") as f:
-            for chunk in r.iter_content(chunk_size=1024):
-                if chunk:
-                    f.write(chunk)
+            with open(dest, "wb") as f:
+                for chunk in r.iter_content(chunk_size=64 * 1024):
+                    if chunk:
+                        f.write(chunk)
 
     def _log(self, msg, level="info"):
         getattr(logger, level)("<comment>{}:</comment> {}".format(self._name, msg))
@@ -1079,14 +1079,11 @@ class VirtualEnv(Env):
         return os.path.exists(self._bin("python")) and os.path.exists(self._bin("pip"))
 
     def _run(self, cmd, **kwargs):
-        with self.temp_environ():
-            os.environ["PATH"] = self._updated_path()
-            os.environ["VIRTUAL_ENV"] = str(self._path)
+        # The environment is passed to the subprocess instead of
+        # temporarily modifying os.environ, which is shared by all threads.
+        kwargs["env"] = self._get_environ(kwargs.get("env"))
 
-            self.unset_env("PYTHONHOME")
-            self.unset_env("__PYVENV_LAUNCHER__")
-
-            return super(VirtualEnv, self)._run(cmd, **kwargs)
+        return super(VirtualEnv, self)._run(cmd, **kwargs)
 
     def execute(self, bin, *args, **kwargs):
         with self.temp_environ():
@@ -1107,6 +1104,18 @@ class VirtualEnv(Env):
             os.environ.clear()
             os.environ.update(environ)
 
+    def _get_environ(
+        self, environ=None
+    ):  # type: (Optional[Dict[str, str]]) -> Dict[str, str]
+        environ = dict(os.environ if environ is None else environ)
+        environ["PATH"] = os.pathsep.join([str(self._bin_dir), environ["PATH"]])
+        environ["VIRTUAL_ENV"] = str(self._path)
+
+        environ.pop("PYTHONHOME", None)
+        environ.pop("__PYVENV_LAUNCHER__", None)
+
+        return environ
+
     def unset_env(self, key):
         if key in os.environ:
             del os.environ[key]
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import re
 import shutil
@@ -18,6 +19,16 @@ try:
 except ImportError:
     from collections import Mapping
 
+try:
+    import urllib.parse as urlparse
+except ImportError:
+    import urlparse
+
+try:
+    from urllib.request import url2pathname
+except ImportError:
+    from urllib import url2pathname
+
 
 _canonicalize_regex = re.compile("[-_]+")
 
@@ -121,6 +132,34 @@ def safe_rmtree(path):
     shutil.rmtree(path, onerror=_on_rm_error)
 
 
+def sha256_file(path, bufsize=1 << 20):  # type: (Path, int) -> str
+    with open(str(path), "rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        h = hashlib.sha256()
+        for content in iter(lambda: f.read(bufsize), b""):
+            h.update(content)
+
+        return h.hexdigest()
+
+
+def is_file_url(url):  # type: (str) -> bool
+    return urlparse.urlparse(url).scheme == "file"
+
+
+def copy_file_url(url, dest):  # type: (str, str) -> None
+    """
+    Copies the local file a file:// URL points to.
+
+    This avoids streaming it through requests,
+    and lets the copy be done by the kernel where possible.
+    """
+    path = url2pathname(urlparse.urlparse(url).path)
+
+    shutil.copyfile(path, str(dest))
+
+
 def merge_dicts(d1, d2):
     for k, v in d2.items():
         if k in d1 and isinstance(d1[k], dict) and isinstance(d2[k], Mapping):
@@ -12,6 +12,8 @@ import pkginfo
 from requests import get
 
 from ._compat import Path
+from .helpers import copy_file_url
+from .helpers import is_file_url
 from .helpers import parse_requires
 from .setup_reader import SetupReader
 from .toml_file import TomlFile
@@ -27,11 +29,16 @@ class Inspector:
 
     @classmethod
     def download(cls, url, dest):  # type: (str, Path) -> None
+        if is_file_url(url):
+            copy_file_url(url, dest)
+
+            return
+
         r = get(url, stream=True)
         r.raise_for_status()
 
         with open(str(dest), "wb") as f:
-            for chunk in r.iter_content(chunk_size=1024):
+            for chunk in r.iter_content(chunk_size=64 * 1024):
                 if chunk:
                     f.write(chunk)
 
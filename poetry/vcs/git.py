@@ -199,6 +199,15 @@ class Git:
     def clone(self, repository, dest):  # type: (...) -> str
         return self.run("clone", repository, str(dest))
 
+    def fetch(self, folder=None):  # type: (...) -> str
+        return self.run("fetch", "origin", folder=folder)
+
+    def reset(self, folder=None):  # type: (...) -> str
+        return self.run("reset", "--hard", folder=folder)
+
+    def clean(self, folder=None):  # type: (...) -> str
+        return self.run("clean", "-xdf", folder=folder)
+
     def checkout(self, rev, folder=None):  # type: (...) -> str
         args = []
         if folder is None and self._work_dir:
@@ -13,6 +13,7 @@ def test_list_displays_default_value_if_not_set(app, config):
     tester.execute("--list")
 
     expected = """cache-dir = "/foo"
+installer.max-workers = 1
 virtualenvs.create = true
 virtualenvs.in-project = false
 virtualenvs.path = {path}  # /foo{sep}virtualenvs
@@ -32,6 +33,7 @@ def test_list_displays_set_get_setting(app, config):
     tester.execute("--list")
 
     expected = """cache-dir = "/foo"
+installer.max-workers = 1
 virtualenvs.create = false
 virtualenvs.in-project = false
 virtualenvs.path = {path}  # /foo{sep}virtualenvs
@@ -79,6 +81,7 @@ def test_list_displays_set_get_local_setting(app, config):
     tester.execute("--list")
 
     expected = """cache-dir = "/foo"
+installer.max-workers = 1
 virtualenvs.create = false
 virtualenvs.in-project = false
 virtualenvs.path = {path}  # /foo{sep}virtualenvs
@@ -90,6 +93,16 @@ virtualenvs.path = {path}  # /foo{sep}virtualenvs
     assert expected == tester.io.fetch_output()
 
 
+def test_set_installer_max_workers(app, config, config_source):
+    command = app.find("config")
+    tester = CommandTester(command)
+
+    tester.execute("installer.max-workers 4")
+
+    assert 4 == config_source.config["installer"]["max-workers"]
+    assert 4 == config.get("installer.max-workers")
+
+
 def test_set_pypi_token(app, config, config_source, auth_config_source):
     command = app.find("config")
     tester = CommandTester(command)
@@ -88,6 +88,7 @@ class Locker(BaseLocker):
     def __init__(self, lock, local_config):
         self._lock = TomlFile(lock)
         self._local_config = local_config
+        self._loader = None
         self._lock_data = None
         self._content_hash = self._get_content_hash()
         self._locked = False
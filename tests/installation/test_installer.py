@@ -1,11 +1,13 @@
 from __future__ import unicode_literals
 
 import sys
+import threading
 
 import pytest
 
 from clikit.io import NullIO
 
+from poetry.config.config import Config
 from poetry.installation import Installer as BaseInstaller
 from poetry.installation.noop_installer import NoopInstaller
 from poetry.packages import Locker as BaseLocker
@@ -33,6 +35,40 @@ class Installer(BaseInstaller):
         return NoopInstaller()
 
 
+class RecordingInstaller(NoopInstaller):
+    """
+    Records when updates start and end.
+
+    Updates of A and C wait for each other, so they can only complete
+    if they are executed concurrently.
+    """
+
+    def __init__(self):
+        super(RecordingInstaller, self).__init__()
+
+        self._events = []
+        self._barrier = threading.Barrier(2, timeout=5)
+
+    @property
+    def events(self):
+        return self._events
+
+    def update(self, source, target):
+        self._events.append(("start", target.name))
+
+        if target.name in {"a", "c"}:
+            self._barrier.wait()
+
+        super(RecordingInstaller, self).update(source, target)
+
+        self._events.append(("end", target.name))
+
+
+class ConcurrentInstaller(BaseInstaller):
+    def _get_installer(self):
+        return RecordingInstaller()
+
+
 class CustomInstalledRepository(InstalledRepository):
     @classmethod
     def load(cls, env):
@@ -1557,3 +1593,59 @@ def test_installer_uses_prereleases_if_they_are_compatible(
     installer.run()
 
     assert len(installer.installer.installs) == 2
+
+
+def add_packages_to_update(package, repo, installed):
+    # A and C are both at the root of the dependency graph while B,
+    # required by A, is one level deeper.
+    for name in ("A", "B", "C"):
+        installed.add_package(get_package(name, "1.0"))
+
+    package_a = get_package("A", "1.1")
+    package_a.add_dependency("B", "^1.0")
+    repo.add_package(package_a)
+    repo.add_package(get_package("B", "1.1"))
+    repo.add_package(get_package("C", "1.1"))
+
+    package.add_dependency("A", "^1.0")
+    package.add_dependency("C", "^1.0")
+
+
+@pytest.mark.skipif(PY2, reason="Concurrent installs require Python 3")
+def test_run_executes_operations_of_a_level_concurrently(
+    package, locker, pool, repo, env, installed
+):
+    config = Config()
+    config.merge({"installer": {"max-workers": 2}})
+    installer = ConcurrentInstaller(
+        NullIO(), env, package, locker, pool, installed=installed, config=config
+    )
+    add_packages_to_update(package, repo, installed)
+
+    installer.run()
+
+    events = installer.installer.events
+    # The deeper level is over before the next one starts
+    assert [("start", "b"), ("end", "b")] == events[:2]
+    # A and C only get past the barrier if they run at the same time
+    assert {("start", "a"), ("start", "c")} == set(events[2:4])
+    assert {("end", "a"), ("end", "c")} == set(events[4:])
+
+
+def test_run_executes_operations_serially_with_a_single_worker(
+    package, locker, pool, repo, env, installed, mocker
+):
+    executor = mocker.patch("poetry.installation.installer.ThreadPoolExecutor")
+    config = Config()
+    config.merge({"installer": {"max-workers": 1}})
+    installer = Installer(
+        NullIO(), env, package, locker, pool, installed=installed, config=config
+    )
+    add_packages_to_update(package, repo, installed)
+
+    installer.run()
+
+    assert not executor.called
+    updates = installer.installer.updates
+    assert "b" == updates[0][1].name
+    assert {"a", "c"} == {target.name for _, target in updates[1:]}
@@ -8,6 +8,7 @@ from poetry.packages.package import Package
 from poetry.repositories.legacy_repository import LegacyRepository
 from poetry.repositories.pool import Pool
 from poetry.utils._compat import Path
+from poetry.utils.env import MockEnv
 from poetry.utils.env import NullEnv
 
 
@@ -92,6 +93,32 @@ def test_install_with_non_pypi_default_repository(pool, installer):
     installer.install(bar)
 
 
+def test_install_batch_runs_pip_once_per_repository():
+    pool = Pool()
+    default = LegacyRepository("default", "https://default.com")
+    another = LegacyRepository("another", "https://another.com")
+    pool.add_repository(default, default=True)
+    pool.add_repository(another)
+
+    null_env = NullEnv()
+    installer = PipInstaller(null_env, NullIO(), pool)
+
+    packages = []
+    for name, repository in [("foo", default), ("bar", another), ("baz", default)]:
+        package = Package(name, "1.0.0")
+        package.source_type = "legacy"
+        package.source_reference = repository._name
+        package.source_url = repository._url
+        packages.append(package)
+
+    installer.install_batch(packages)
+
+    assert len(null_env.executed) == 2
+    assert "foo==1.0.0" in null_env.executed[0]
+    assert "baz==1.0.0" in null_env.executed[0]
+    assert "bar==1.0.0" in null_env.executed[1]
+
+
 def test_install_with_cert():
     ca_path = "path/to/cert.pem"
     pool = Pool()
@@ -193,3 +220,141 @@ def test_uninstall_git_package_nspkg_pth_cleanup(mocker, tmp_venv, pool):
     # any command in the virtual environment should trigger the error message
     output = tmp_venv.run("python", "-m", "site")
     assert "Error processing line 1 of {}".format(pth_file_candidate) not in output
+
+
+def test_install_pure_wheel_file_without_pip(tmp_dir):
+    site_packages = Path(tmp_dir) / "site-packages"
+    site_packages.mkdir()
+    env = MockEnv(sys_path=[str(site_packages)])
+    installer = PipInstaller(env, NullIO(), Pool())
+
+    demo = Package("demo", "0.1.0")
+    demo.source_type = "file"
+    demo.source_url = str(
+        Path(__file__).parent.parent
+        / "fixtures"
+        / "distributions"
+        / "demo-0.1.0-py2.py3-none-any.whl"
+    )
+
+    installer.install(demo)
+
+    assert [] == env.executed
+    assert (site_packages / "demo" / "__init__.py").exists()
+
+    dist_info = site_packages / "demo-0.1.0.dist-info"
+    assert b"poetry\n" == (dist_info / "INSTALLER").read_bytes()
+    record = (dist_info / "RECORD").read_text()
+    assert "demo-0.1.0.dist-info/INSTALLER,sha256=" in record
+
+
+def test_install_sdist_file_with_pip(tmp_dir):
+    env = MockEnv(sys_path=[str(Path(tmp_dir) / "site-packages")])
+    installer = PipInstaller(env, NullIO(), Pool())
+
+    demo = Package("demo", "0.1.0")
+    demo.source_type = "file"
+    demo.source_url = str(
+        Path(__file__).parent.parent
+        / "fixtures"
+        / "distributions"
+        / "demo-0.1.0.tar.gz"
+    )
+
+    installer.install(demo)
+
+    assert 1 == len(env.executed)
+    assert demo.source_url in env.executed[0]
+
+
+def test_install_git_updates_existing_clone(tmp_dir, mocker, package_git):
+    package_git.source_reference = "9cf87a285a2d3fbb0b9fa621997b3acc3631ed24"
+    src_dir = Path(tmp_dir) / "src" / "demo"
+    (src_dir / ".git").mkdir(parents=True)
+    mocker.patch(
+        "poetry.vcs.git.Git.remote_urls",
+        return_value={"remote.origin.url": package_git.source_url},
+    )
+    fetch = mocker.patch("poetry.vcs.git.Git.fetch")
+    checkout = mocker.patch("poetry.vcs.git.Git.checkout")
+    reset = mocker.patch("poetry.vcs.git.Git.reset")
+    git_clean = mocker.patch("poetry.vcs.git.Git.clean")
+    clone = mocker.patch("poetry.vcs.git.Git.clone")
+    install_directory = mocker.patch(
+        "poetry.installation.pip_installer.PipInstaller.install_directory"
+    )
+    installer = PipInstaller(NullEnv(path=Path(tmp_dir)), NullIO(), Pool())
+
+    installer.install(package_git)
+
+    fetch.assert_called_once_with(folder=src_dir)
+    checkout.assert_called_once_with(package_git.source_reference, src_dir)
+    reset.assert_called_once_with(folder=src_dir)
+    git_clean.assert_called_once_with(folder=src_dir)
+    assert not clone.called
+    assert src_dir.exists()
+    assert str(src_dir) == install_directory.call_args[0][0].source_url
+
+
+def test_install_git_clones_when_existing_clone_has_another_remote(
+    tmp_dir, mocker, package_git
+):
+    package_git.source_reference = "9cf87a285a2d3fbb0b9fa621997b3acc3631ed24"
+    src_dir = Path(tmp_dir) / "src" / "demo"
+    (src_dir / ".git").mkdir(parents=True)
+    mocker.patch(
+        "poetry.vcs.git.Git.remote_urls",
+        return_value={"remote.origin.url": "git@github.com:other/demo.git"},
+    )
+    fetch = mocker.patch("poetry.vcs.git.Git.fetch")
+    clone = mocker.patch("poetry.vcs.git.Git.clone")
+    mocker.patch("poetry.installation.pip_installer.PipInstaller.install_directory")
+    installer = PipInstaller(NullEnv(path=Path(tmp_dir)), NullIO(), Pool())
+
+    installer.install(package_git)
+
+    assert not fetch.called
+    clone.assert_called_once_with(package_git.source_url, src_dir)
+
+
+def test_install_git_clones_when_reference_is_not_a_commit(
+    tmp_dir, mocker, package_git
+):
+    src_dir = Path(tmp_dir) / "src" / "demo"
+    (src_dir / ".git").mkdir(parents=True)
+    mocker.patch(
+        "poetry.vcs.git.Git.remote_urls",
+        return_value={"remote.origin.url": package_git.source_url},
+    )
+    fetch = mocker.patch("poetry.vcs.git.Git.fetch")
+    clone = mocker.patch("poetry.vcs.git.Git.clone")
+    mocker.patch("poetry.installation.pip_installer.PipInstaller.install_directory")
+    installer = PipInstaller(NullEnv(path=Path(tmp_dir)), NullIO(), Pool())
+
+    installer.install(package_git)
+
+    assert not fetch.called
+    clone.assert_called_once_with(package_git.source_url, src_dir)
+
+
+def test_install_directory_generates_a_temporary_setup_file(mocker):
+    project = Path(__file__).parent.parent / "fixtures" / "simple_project"
+    setup = project / "setup.py"
+    setup_contents = []
+
+    def run(*args):
+        setup_contents.append(setup.read_bytes())
+
+    installer = PipInstaller(NullEnv(), NullIO(), Pool())
+    mocker.patch.object(installer, "run", side_effect=run)
+
+    package = Package("simple-project", "1.2.3")
+    package.source_type = "directory"
+    package.source_url = str(project)
+    package.develop = True
+
+    installer.install(package)
+
+    assert 1 == len(setup_contents)
+    assert b"from setuptools import setup" in setup_contents[0]
+    assert not setup.exists()
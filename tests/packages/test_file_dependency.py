@@ -15,3 +15,22 @@ def test_file_dependency_wrong_path():
 def test_file_dependency_dir():
     with pytest.raises(ValueError):
         FileDependency("demo", DIST_PATH)
+
+
+def test_file_dependency_hash_is_recomputed_when_the_file_changes(tmp_dir):
+    path = Path(tmp_dir) / "demo-0.1.0.tar.gz"
+    path.write_bytes(b"foo")
+    dependency = FileDependency("demo", path)
+
+    assert (
+        "2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae"
+        == dependency.hash()
+    )
+    assert dependency.hash() == FileDependency("demo", path).hash()
+
+    path.write_bytes(b"foobar")
+
+    assert (
+        "c3ab8ff13720e8ad9047dd39466b3c8974e592c2fa383d4a3960714caef0c4f2"
+        == dependency.hash()
+    )
@@ -246,3 +246,20 @@ A = []
 """
 
     assert expected == content
+
+
+def test_locker_uses_custom_loader_to_read_lock_data(locker, root):
+    locker.set_lock_data(root, [get_package("A", "1.0.0")])
+
+    calls = []
+
+    def loader(path):
+        calls.append(path)
+
+        return {"package": [], "metadata": {"content-hash": "123456789"}}
+
+    locker = Locker(locker.lock.path, {}, loader=loader)
+
+    assert locker.is_locked()
+    assert not locker.is_fresh()
+    assert [locker.lock.path, locker.lock.path] == calls
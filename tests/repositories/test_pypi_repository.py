@@ -215,3 +215,17 @@ def test_urls():
 
     assert "https://pypi.org/simple/" == repository.url
     assert "https://pypi.org/simple/" == repository.authenticated_url
+
+
+def test_download_reuses_the_same_session(http, tmp_dir, mocker):
+    url = "https://files.pythonhosted.org/packages/foo-1.0.tar.gz"
+    http.register_uri(http.GET, url, body=b"foo" * 1024)
+    repository = PyPiRepository()
+    get = mocker.spy(repository._download_session, "get")
+
+    dest = Path(tmp_dir) / "foo-1.0.tar.gz"
+    repository._download(url, str(dest))
+    repository._download(url, str(dest))
+
+    assert 2 == get.call_count
+    assert b"foo" * 1024 == dest.read_bytes()
@@ -4,7 +4,12 @@ from __future__ import unicode_literals
 
 import pytest
 
+from clikit.api.io.flags import DEBUG
+from clikit.io import BufferedIO
+from tomlkit.exceptions import TOMLKitError
+
 from poetry.factory import Factory
+from poetry.factory import _load_optional_toml
 from poetry.utils._compat import PY2
 from poetry.utils._compat import Path
 from poetry.utils.toml_file import TomlFile
@@ -205,3 +210,60 @@ def test_create_poetry_with_local_config(fixture_dir):
 
     assert not poetry.config.get("virtualenvs.in-project")
     assert not poetry.config.get("virtualenvs.create")
+
+
+def test_load_optional_toml_is_refreshed_when_the_file_changes(tmp_dir):
+    config_file = Path(tmp_dir) / "config.toml"
+    assert _load_optional_toml(config_file) is None
+
+    config_file.write_text("[virtualenvs]\ncreate = false\n")
+
+    config = _load_optional_toml(config_file)
+    assert {"virtualenvs": {"create": False}} == config
+
+    config["virtualenvs"]["create"] = True
+    assert {"virtualenvs": {"create": False}} == _load_optional_toml(config_file)
+
+    config_file.write_text("[virtualenvs]\nin-project = true\n")
+
+    assert {"virtualenvs": {"in-project": True}} == _load_optional_toml(config_file)
+
+
+def test_load_optional_toml_reports_invalid_files_with_tomlkit(tmp_dir):
+    config_file = Path(tmp_dir) / "config.toml"
+    config_file.write_text("[virtualenvs]\ncreate = = false\n")
+
+    with pytest.raises(TOMLKitError):
+        _load_optional_toml(config_file)
+
+
+def test_create_config_is_refreshed_when_the_files_change(tmp_dir, mocker):
+    mocker.patch("poetry.factory.CONFIG_DIR", tmp_dir)
+    config_file = Path(tmp_dir) / "config.toml"
+    config_file.write_text("[virtualenvs]\ncreate = false\n")
+
+    config = Factory.create_config()
+    assert not config.get("virtualenvs.create")
+
+    config.merge({"virtualenvs": {"in-project": True}})
+    assert not Factory.create_config().get("virtualenvs.in-project")
+
+    config_file.write_text("[virtualenvs]\ncreate = true\nin-project = true\n")
+
+    config = Factory.create_config()
+    assert config.get("virtualenvs.create")
+    assert config.get("virtualenvs.in-project")
+
+
+def test_create_config_always_reports_loaded_files(tmp_dir, mocker):
+    mocker.patch("poetry.factory.CONFIG_DIR", tmp_dir)
+    config_file = Path(tmp_dir) / "config.toml"
+    config_file.write_text("[virtualenvs]\ncreate = false\n")
+
+    for _ in range(2):
+        io = BufferedIO()
+        io.set_verbosity(DEBUG)
+
+        Factory.create_config(io)
+
+        assert "Loading configuration file {}".format(config_file) in io.fetch_output()
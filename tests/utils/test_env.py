@@ -70,6 +70,22 @@ def test_virtualenvs_with_spaces_in_their_path_work_as_expected(tmp_dir, manager
     assert venv.run("python", "-V", shell=True).startswith("Python")
 
 
+def test_run_does_not_modify_the_process_environment(tmp_dir, manager, mocker):
+    venv_path = Path(tmp_dir) / "Virtual Env"
+    manager.build_venv(str(venv_path))
+    venv = VirtualEnv(venv_path)
+
+    mocker.patch.dict(os.environ, {"PYTHONHOME": "/foo"})
+    environ = dict(os.environ)
+
+    output = venv.run(
+        "python", "-", input_="import os; print(os.environ.get('VIRTUAL_ENV'))"
+    )
+
+    assert str(venv_path) == output.strip()
+    assert environ == os.environ
+
+
 def test_env_get_in_project_venv(manager, poetry):
     if "VIRTUAL_ENV" in os.environ:
         del os.environ["VIRTUAL_ENV"]
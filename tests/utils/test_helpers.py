@@ -1,7 +1,11 @@
+import hashlib
+
 from poetry.utils._compat import Path
+from poetry.utils.helpers import copy_file_url
 from poetry.utils.helpers import get_cert
 from poetry.utils.helpers import get_client_cert
 from poetry.utils.helpers import parse_requires
+from poetry.utils.helpers import sha256_file
 
 
 def test_parse_requires():
@@ -65,3 +69,22 @@ def test_get_client_cert(config):
     config.merge({"certificates": {"foo": {"client-cert": client_cert}}})
 
     assert get_client_cert(config, "foo") == Path(client_cert)
+
+
+def test_sha256_file(tmp_dir):
+    path = Path(tmp_dir) / "foo.txt"
+    path.write_bytes(b"foo" * (1 << 19))
+
+    assert hashlib.sha256(b"foo" * (1 << 19)).hexdigest() == sha256_file(
+        path, bufsize=1024
+    )
+
+
+def test_copy_file_url(tmp_dir):
+    source = Path(tmp_dir) / "foo-1.0.0.tar.gz"
+    source.write_bytes(b"foo")
+    dest = Path(tmp_dir) / "dest.tar.gz"
+
+    copy_file_url(source.as_uri() + "#sha256=123456", str(dest))
+
+    assert b"foo" == dest.read_bytes()